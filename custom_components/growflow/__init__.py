@@ -5,23 +5,44 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, CONF_GROWBOX_NAME, CONF_PLANT_NAME
+from .const import DOMAIN, DATA_PLANT_ENTRIES, CONF_GROWBOX_NAME, CONF_PLANT_NAME
 from .growbox.coordinator import GrowboxCoordinator
 from .plant.coordinator import PlantCoordinator
 from .plant.services import async_setup_services, async_unload_services
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 # Platforms die wir unterstützen
-PLATFORMS: list[Platform] = [
+PLATFORMS: tuple[Platform, ...] = (
     Platform.SENSOR, 
     Platform.NUMBER, 
     Platform.DATE, 
     Platform.TEXT, 
     Platform.SELECT,
     Platform.BUTTON,  # ✅ NEW: Button platform
-]
+)
+
+# Growbox verwendet nur sensor und number platforms
+GROWBOX_PLATFORMS: tuple[Platform, ...] = (Platform.SENSOR, Platform.NUMBER)
+
+
+def _platforms_for(entry: ConfigEntry) -> tuple[Platform, ...]:
+    """Return the platforms used by a config entry."""
+    if CONF_GROWBOX_NAME in entry.data:
+        return GROWBOX_PLATFORMS
+    return PLATFORMS
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the GrowFlow integration."""
+    hass.data[DOMAIN] = {}
+    hass.data[DATA_PLANT_ENTRIES] = set()
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -32,14 +53,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Growbox Coordinator erstellen
         coordinator = GrowboxCoordinator(hass, entry)
         device_type = "growbox"
-        # Growbox verwendet nur sensor und number platforms
-        platforms = [Platform.SENSOR, Platform.NUMBER]
     elif CONF_PLANT_NAME in entry.data:
         # Plant Coordinator erstellen
         coordinator = PlantCoordinator(hass, entry)
         device_type = "plant"
-        # Plant verwendet alle platforms
-        platforms = PLATFORMS
     else:
         _LOGGER.error("Unknown device type in config entry: %s", entry.data)
         return False
@@ -47,20 +64,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await coordinator.async_config_entry_first_refresh()
     
     # Coordinator in hass.data speichern
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
     
     # Plant Services einmalig registrieren (beim ersten Plant)
     if device_type == "plant":
-        if not any(
-            isinstance(coord, PlantCoordinator) 
-            for coord in hass.data[DOMAIN].values() 
-            if coord != coordinator
-        ):
+        plant_entries: set[str] = hass.data[DATA_PLANT_ENTRIES]
+        if not plant_entries:
             async_setup_services(hass)
+        plant_entries.add(entry.entry_id)
     
     # Platforms laden
-    await hass.config_entries.async_forward_entry_setups(entry, platforms)
+    await hass.config_entries.async_forward_entry_setups(entry, _platforms_for(entry))
     
     _LOGGER.info("GrowFlow %s setup completed for %s", device_type, entry.title)
     return True
@@ -69,23 +83,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     
-    # Determine platforms to unload
-    if CONF_GROWBOX_NAME in entry.data:
-        platforms = [Platform.SENSOR, Platform.NUMBER]
-    else:
-        platforms = PLATFORMS
-    
     # Platforms entladen
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, platforms):
+    if unload_ok := await hass.config_entries.async_unload_platforms(
+        entry, _platforms_for(entry)
+    ):
         coordinator = hass.data[DOMAIN].pop(entry.entry_id)
         
         # Plant Services entladen wenn das der letzte Plant war
         if isinstance(coordinator, PlantCoordinator):
-            remaining_plants = any(
-                isinstance(coord, PlantCoordinator) 
-                for coord in hass.data[DOMAIN].values()
-            )
-            if not remaining_plants:
+            plant_entries: set[str] = hass.data[DATA_PLANT_ENTRIES]
+            plant_entries.discard(entry.entry_id)
+            if not plant_entries:
                 async_unload_services(hass)
     
     return unload_ok
\ No newline at end of file
@@ -3,13 +3,13 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 from typing import Any
 from datetime import date
 
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.const import CONF_NAME
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 from homeassistant.util import dt as dt_util
@@ -30,9 +30,16 @@ from .const import (
     GROWTH_STAGES,
     GROWTH_STAGE_EARLY_VEG,
 )
+from .utils import parse_iso_date
 
 _LOGGER = logging.getLogger(__name__)
 
+# Characters stripped from the strain when generating plant names
+_STRAIN_CLEAN_RE = re.compile(r'[^a-zA-Z0-9\s]')
+
+# Entity selector values (stripped, lowercase) that mean "no entity"
+_EMPTY_ENTITY_VALUES = frozenset({"", "none", "null"})
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required("device_type", default="growbox"): vol.In(["growbox", "plant"]),
@@ -53,17 +60,28 @@ STEP_PLANT_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Entity selectors shared by the growbox sensor step and the options flow
+_TEMPERATURE_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="sensor", device_class="temperature")
+)
+_HUMIDITY_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="sensor", device_class="humidity")
+)
+_HYGROSTAT_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain=["switch", "fan", "humidifier"])
+)
+
+_ENTITY_SELECTORS = (
+    (CONF_TEMPERATURE_ENTITY, _TEMPERATURE_SELECTOR),
+    (CONF_HUMIDITY_ENTITY, _HUMIDITY_SELECTOR),
+    (CONF_HYGROSTAT_ENTITY, _HYGROSTAT_SELECTOR),
+)
+
 STEP_SENSORS_DATA_SCHEMA = vol.Schema(
     {
-        vol.Optional(CONF_TEMPERATURE_ENTITY): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain="sensor", device_class="temperature")
-        ),
-        vol.Optional(CONF_HUMIDITY_ENTITY): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain="sensor", device_class="humidity")
-        ),
-        vol.Optional(CONF_HYGROSTAT_ENTITY): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain=["switch", "fan", "humidifier"])
-        ),
+        vol.Optional(CONF_TEMPERATURE_ENTITY): _TEMPERATURE_SELECTOR,
+        vol.Optional(CONF_HUMIDITY_ENTITY): _HUMIDITY_SELECTOR,
+        vol.Optional(CONF_HYGROSTAT_ENTITY): _HYGROSTAT_SELECTOR,
         vol.Optional(CONF_TARGET_VPD, default=DEFAULT_TARGET_VPD): vol.All(
             vol.Coerce(float), vol.Range(min=0.4, max=2.0)
         ),
@@ -71,6 +89,14 @@ STEP_SENSORS_DATA_SCHEMA = vol.Schema(
 )
 
 
+@lru_cache(maxsize=8)
+def _growbox_schema(growbox_names: frozenset[str]) -> vol.Schema:
+    """Return the growbox assignment schema for the given growbox names."""
+    return vol.Schema({
+        vol.Required(CONF_PLANT_GROWBOX): vol.In(sorted(growbox_names)),
+    })
+
+
 class GrowFlowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for GrowFlow."""
 
@@ -80,6 +106,7 @@ class GrowFlowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize config flow."""
         self._data: dict[str, Any] = {}
         self._device_type: str | None = None
+        self._available_growboxes: list[str] = []
 
     @staticmethod
     def async_get_options_flow(
@@ -90,28 +117,22 @@ class GrowFlowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return GrowFlowOptionsFlow()
         return None
 
-    def _generate_plant_name(self, strain: str) -> str:
+    def _generate_plant_name(self, strain: str, plant_names: list[str]) -> str:
         """Generate unique plant name with auto-numbering."""
-        clean_strain = re.sub(r'[^a-zA-Z0-9\s]', '', strain).strip()
+        clean_strain = _STRAIN_CLEAN_RE.sub('', strain).strip()
         if not clean_strain:
             clean_strain = "Unknown"
         
-        existing_entries = self._async_current_entries()
-        existing_numbers = set()
+        # Numbers of removed plants are not reused
+        max_number = 0
         
-        for entry in existing_entries:
-            if entry.data.get(CONF_PLANT_NAME):
-                plant_name = entry.data[CONF_PLANT_NAME]
-                if plant_name.startswith(clean_strain):
-                    remaining = plant_name[len(clean_strain):].strip()
-                    if remaining.isdigit():
-                        existing_numbers.add(int(remaining))
+        for plant_name in plant_names:
+            if plant_name.startswith(clean_strain):
+                remaining = plant_name[len(clean_strain):].strip()
+                if remaining.isdigit():
+                    max_number = max(max_number, int(remaining))
         
-        next_number = 1
-        while next_number in existing_numbers:
-            next_number += 1
-        
-        return f"{clean_strain} {next_number}"
+        return f"{clean_strain} {max_number + 1}"
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -136,13 +157,13 @@ class GrowFlowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            existing_entries = self._async_current_entries()
-            for entry in existing_entries:
-                if entry.data.get(CONF_GROWBOX_NAME) == user_input[CONF_GROWBOX_NAME]:
-                    errors["base"] = "name_exists"
-                    break
-
-            if not errors:
+            existing_names = {
+                entry.data.get(CONF_GROWBOX_NAME)
+                for entry in self._async_current_entries()
+            }
+            if user_input[CONF_GROWBOX_NAME] in existing_names:
+                errors["base"] = "name_exists"
+            else:
                 self._data.update(user_input)
                 return await self.async_step_sensors()
 
@@ -159,48 +180,38 @@ class GrowFlowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
+            # DateSelector submits an ISO string, the schema default is a date
             planted_date = user_input.get(CONF_PLANTED_DATE)
+            if isinstance(planted_date, str):
+                planted_date = parse_iso_date(planted_date)
             
-            try:
-                if planted_date is None or planted_date == "":
-                    user_input[CONF_PLANTED_DATE] = dt_util.now().date()
-                    _LOGGER.warning("No planted date provided, using today")
-                elif isinstance(planted_date, str):
-                    if planted_date.strip() == "":
-                        user_input[CONF_PLANTED_DATE] = dt_util.now().date()
-                    else:
-                        parsed_date = dt_util.parse_date(planted_date)
-                        if parsed_date:
-                            user_input[CONF_PLANTED_DATE] = parsed_date
-                        else:
-                            user_input[CONF_PLANTED_DATE] = dt_util.now().date()
-                            _LOGGER.error("Could not parse planted date: %s", planted_date)
-                elif not isinstance(planted_date, date):
-                    user_input[CONF_PLANTED_DATE] = dt_util.now().date()
-                    _LOGGER.error("Invalid planted date type: %s", type(planted_date))
-                
-                today = dt_util.now().date()
-                if user_input[CONF_PLANTED_DATE] > today:
-                    user_input[CONF_PLANTED_DATE] = today
-                    _LOGGER.warning("Planted date was in future, using today")
-                    
-            except Exception as e:
-                user_input[CONF_PLANTED_DATE] = dt_util.now().date()
-                _LOGGER.error("Error processing planted date: %s", str(e))
-            
-            strain = user_input[CONF_PLANT_STRAIN]
-            plant_name = self._generate_plant_name(strain)
-            user_input[CONF_PLANT_NAME] = plant_name
+            today = dt_util.now().date()
+            if not isinstance(planted_date, date):
+                _LOGGER.warning("Invalid planted date %r, using today",
+                                user_input.get(CONF_PLANTED_DATE))
+                planted_date = today
+            elif planted_date > today:
+                _LOGGER.warning("Planted date was in future, using today")
+                planted_date = today
+            user_input[CONF_PLANTED_DATE] = planted_date
             
-            existing_entries = self._async_current_entries()
+            # Collect plant and growbox names in a single pass over the entries
+            plant_names = []
             available_growboxes = []
-            for entry in existing_entries:
-                if entry.data.get(CONF_GROWBOX_NAME):
+            for entry in self._async_current_entries():
+                if entry.data.get(CONF_PLANT_NAME):
+                    plant_names.append(entry.data[CONF_PLANT_NAME])
+                elif entry.data.get(CONF_GROWBOX_NAME):
                     available_growboxes.append(entry.data[CONF_GROWBOX_NAME])
             
+            strain = user_input[CONF_PLANT_STRAIN]
+            plant_name = self._generate_plant_name(strain, plant_names)
+            user_input[CONF_PLANT_NAME] = plant_name
+            
             if not available_growboxes:
                 errors["base"] = "no_growboxes"
             else:
+                self._available_growboxes = available_growboxes
                 self._data.update(user_input)
                 return await self.async_step_plant_growbox()
 
@@ -225,19 +236,9 @@ class GrowFlowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 data=self._data,
             )
 
-        existing_entries = self._async_current_entries()
-        available_growboxes = []
-        for entry in existing_entries:
-            if entry.data.get(CONF_GROWBOX_NAME):
-                available_growboxes.append(entry.data[CONF_GROWBOX_NAME])
-
-        growbox_schema = vol.Schema({
-            vol.Required(CONF_PLANT_GROWBOX): vol.In(available_growboxes),
-        })
-
         return self.async_show_form(
             step_id="plant_growbox",
-            data_schema=growbox_schema,
+            data_schema=_growbox_schema(frozenset(self._available_growboxes)),
             description_placeholders={
                 "plant_name": self._data.get(CONF_PLANT_NAME, "Plant"),
             },
@@ -269,23 +270,11 @@ class GrowFlowOptionsFlow(config_entries.OptionsFlow):
 
     def _clean_entity_value(self, value: Any) -> str | None:
         """Clean entity selector value, return None for empty/invalid values."""
-        _LOGGER.debug(f"Cleaning entity value: {repr(value)} (type: {type(value)})")
+        _LOGGER.debug("Cleaning entity value: %r (type: %s)", value, type(value))
         
-        if value is None:
-            return None
-        if value == "":
-            return None
-        if value == "None":
-            return None
         if isinstance(value, str):
             stripped = value.strip()
-            if stripped == "":
-                return None
-            if stripped.lower() == "none":
-                return None
-            if stripped == "null":
-                return None
-            return stripped
+            return None if stripped.lower() in _EMPTY_ENTITY_VALUES else stripped
         return str(value) if value else None
 
     async def async_step_init(
@@ -293,7 +282,7 @@ class GrowFlowOptionsFlow(config_entries.OptionsFlow):
     ) -> FlowResult:
         """Manage the options for growboxes only."""
         if user_input is not None:
-            _LOGGER.debug(f"Received user input: {user_input}")
+            _LOGGER.debug("Received user input: %s", user_input)
             
             # Start fresh - only keep what's actually in user_input
             cleaned_input = {}
@@ -307,21 +296,24 @@ class GrowFlowOptionsFlow(config_entries.OptionsFlow):
                     cleaned_value = self._clean_entity_value(user_input[key])
                     if cleaned_value is not None:
                         cleaned_input[key] = cleaned_value
-                        _LOGGER.debug(f"Keeping entity {key}: {cleaned_value}")
+                        _LOGGER.debug("Keeping entity %s: %s", key, cleaned_value)
                     else:
-                        _LOGGER.debug(f"Entity {key} had empty value, removing")
+                        _LOGGER.debug("Entity %s had empty value, removing", key)
                 else:
                     # Entity was NOT in user_input - user cleared it with X button
-                    _LOGGER.debug(f"Entity {key} missing from input - was cleared by user")
+                    _LOGGER.debug("Entity %s missing from input - was cleared by user", key)
             
             # Handle non-entity fields (but remove target_vpd as requested)
             for key, value in user_input.items():
                 if key not in entity_fields and key != CONF_TARGET_VPD:
                     cleaned_input[key] = value
             
-            _LOGGER.debug(f"Final cleaned input: {cleaned_input}")
-            
             coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]
+            # The options replace the stored ones - keep the saved target VPD
+            cleaned_input[CONF_TARGET_VPD] = coordinator.target_vpd
+            
+            _LOGGER.debug("Final cleaned input: %s", cleaned_input)
+            
             coordinator.update_config(user_input)
             await coordinator.async_request_refresh()
             
@@ -333,51 +325,14 @@ class GrowFlowOptionsFlow(config_entries.OptionsFlow):
             return self.async_abort(reason="not_supported")
         
         # Create schema with proper defaults for entity selectors
-        # Priority: options > data (options can override/clear entities from data)
+        # Priority: options > data (options can override/clear entities from data,
+        # None means removed); current_data already merges them in that order
         schema_dict = {}
-        
-        # Check if entity is configured (options override data, None means removed)
-        entity_configs = {}
-        for entity_key in [CONF_TEMPERATURE_ENTITY, CONF_HUMIDITY_ENTITY, CONF_HYGROSTAT_ENTITY]:
-            if entity_key in self.config_entry.options:
-                # Options have this key, use its value (could be None if cleared)
-                entity_configs[entity_key] = self.config_entry.options[entity_key]
-            else:
-                # Not in options, use original data value
-                entity_configs[entity_key] = self.config_entry.data.get(entity_key)
-        
-        # Temperature entity
-        temp_entity = entity_configs[CONF_TEMPERATURE_ENTITY]
-        if temp_entity:
-            schema_dict[vol.Optional(CONF_TEMPERATURE_ENTITY, default=temp_entity)] = selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="sensor", device_class="temperature")
-            )
-        else:
-            schema_dict[vol.Optional(CONF_TEMPERATURE_ENTITY)] = selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="sensor", device_class="temperature")
-            )
-        
-        # Humidity entity
-        humidity_entity = entity_configs[CONF_HUMIDITY_ENTITY]
-        if humidity_entity:
-            schema_dict[vol.Optional(CONF_HUMIDITY_ENTITY, default=humidity_entity)] = selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="sensor", device_class="humidity")
-            )
-        else:
-            schema_dict[vol.Optional(CONF_HUMIDITY_ENTITY)] = selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="sensor", device_class="humidity")
-            )
-        
-        # Hygrostat entity
-        hygrostat_entity = entity_configs[CONF_HYGROSTAT_ENTITY]
-        if hygrostat_entity:
-            schema_dict[vol.Optional(CONF_HYGROSTAT_ENTITY, default=hygrostat_entity)] = selector.EntitySelector(
-                selector.EntitySelectorConfig(domain=["switch", "fan", "humidifier"])
-            )
-        else:
-            schema_dict[vol.Optional(CONF_HYGROSTAT_ENTITY)] = selector.EntitySelector(
-                selector.EntitySelectorConfig(domain=["switch", "fan", "humidifier"])
-            )
+        for entity_key, entity_selector in _ENTITY_SELECTORS:
+            entity_id = current_data.get(entity_key)
+            key = (vol.Optional(entity_key, default=entity_id) if entity_id
+                   else vol.Optional(entity_key))
+            schema_dict[key] = entity_selector
         
         options_schema = vol.Schema(schema_dict)
 
@@ -1,10 +1,14 @@
 """Constants for the GrowFlow integration."""
+from types import MappingProxyType
 
 # Integration info
 DOMAIN = "growflow"
 MANUFACTURER = "GrowFlow"
 MODEL = "Growbox"
 
+# hass.data key holding the entry ids of all loaded plants
+DATA_PLANT_ENTRIES = f"{DOMAIN}_plant_entries"
+
 # Config flow
 CONF_GROWBOX_NAME = "growbox_name"
 CONF_TEMPERATURE_ENTITY = "temperature_entity"
@@ -54,6 +58,8 @@ CONF_GROWTH_STAGE = "growth_stage"
 # Watering System
 CONF_DEFAULT_WATER_VOLUME = "default_water_volume"
 DEFAULT_WATER_VOLUME = 2000  # 2 Liter in ml
+MAX_WATERING_HISTORY = 500  # Entries kept in the config entry
+MAX_PLANT_HISTORY = 500  # Notes kept in memory per plant
 
 # ✅ UPDATED: Growth stages with Drying and Curing instead of Done
 GROWTH_STAGE_EARLY_VEG = "early_veg"
@@ -75,8 +81,8 @@ GROWTH_STAGE_LABELS = {
     GROWTH_STAGE_CURING: "Curing",
 }
 
-# ✅ UPDATED: Growth stages list
-GROWTH_STAGES = [
+# ✅ UPDATED: Growth stages in UI order
+GROWTH_STAGES = (
     GROWTH_STAGE_EARLY_VEG,
     GROWTH_STAGE_MID_LATE_VEG,
     GROWTH_STAGE_EARLY_FLOWER,
@@ -84,24 +90,20 @@ GROWTH_STAGES = [
     GROWTH_STAGE_FLUSHING,
     GROWTH_STAGE_DRYING, 
     GROWTH_STAGE_CURING, 
-]
+)
 
-# Legacy growth stages (for backward compatibility) 
-GROWTH_STAGE_SEEDLING = "early_veg"  # Map to new system
-GROWTH_STAGE_VEGETATIVE = "mid_late_veg"  # Map to combined veg phase
-GROWTH_STAGE_FLOWERING = "early_flower"
-GROWTH_STAGE_HARVEST = "drying"  # ✅ UPDATED: Map old harvest to drying
-GROWTH_STAGE_DONE = "curing"     # ✅ UPDATED: Map old done to curing
+# Growth stages for membership tests
+GROWTH_STAGES_SET = frozenset(GROWTH_STAGES)
 
 # ✅ UPDATED: Legacy mapping for migration (old -> new)
-LEGACY_PHASE_MAPPING = {
+LEGACY_PHASE_MAPPING = MappingProxyType({
     "mid_veg": "mid_late_veg",
     "late_veg": "mid_late_veg",
     "mid_flower": "mid_late_flower",
     "late_flower": "mid_late_flower",
     "done": "curing",      
     "harvest": "drying",   
-}
+})
 
 # Plant units (simplified)
 UNIT_DAYS = "days"
@@ -121,6 +123,6 @@ ATTR_TOTAL_VEG_DAYS = "total_veg_days"
 ATTR_TOTAL_FLOWER_DAYS = "total_flower_days"
 
 # ✅ UPDATED: Phase categorization with new phases
-VEG_PHASES = [GROWTH_STAGE_EARLY_VEG, GROWTH_STAGE_MID_LATE_VEG]
-FLOWER_PHASES = [GROWTH_STAGE_EARLY_FLOWER, GROWTH_STAGE_MID_LATE_FLOWER, GROWTH_STAGE_FLUSHING]
-POST_HARVEST_PHASES = [GROWTH_STAGE_DRYING, GROWTH_STAGE_CURING]
\ No newline at end of file
+VEG_PHASES = (GROWTH_STAGE_EARLY_VEG, GROWTH_STAGE_MID_LATE_VEG)
+FLOWER_PHASES = (GROWTH_STAGE_EARLY_FLOWER, GROWTH_STAGE_MID_LATE_FLOWER, GROWTH_STAGE_FLUSHING)
+POST_HARVEST_PHASES = (GROWTH_STAGE_DRYING, GROWTH_STAGE_CURING)
\ No newline at end of file
@@ -6,7 +6,17 @@ from datetime import timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from ..const import (
@@ -18,11 +28,22 @@ from ..const import (
     CONF_HYGROSTAT_ENTITY,
     CONF_TARGET_VPD,
     DEFAULT_TARGET_VPD,
+    MANUFACTURER,
+    MODEL,
 )
-from ..utils import calculate_vpd, calculate_target_humidity
+from ..utils import calculate_vpd, calculate_target_humidity, get_vpd_status
 
 _LOGGER = logging.getLogger(__name__)
 
+# Source states without a usable reading
+_NO_READING_STATES = frozenset({STATE_UNAVAILABLE, STATE_UNKNOWN, "None"})
+
+# Entity option values that mean "no entity configured"
+_EMPTY_ENTITY_TOKENS = frozenset({"", "none"})
+
+# Seconds to wait before persisting target VPD changes
+TARGET_VPD_SAVE_DELAY = 2.0
+
 
 class GrowboxCoordinator(DataUpdateCoordinator):
     """Coordinator to manage Growbox data."""
@@ -42,29 +63,114 @@ class GrowboxCoordinator(DataUpdateCoordinator):
         self.temperature_entity = get_entity_config(CONF_TEMPERATURE_ENTITY)
         self.humidity_entity = get_entity_config(CONF_HUMIDITY_ENTITY)
         self.hygrostat_entity = get_entity_config(CONF_HYGROSTAT_ENTITY)
-        self.target_vpd = entry.data.get(CONF_TARGET_VPD, DEFAULT_TARGET_VPD)
+        # Saved target VPD lives in the options, the setup value in data
+        self.target_vpd = entry.options.get(
+            CONF_TARGET_VPD, entry.data.get(CONF_TARGET_VPD, DEFAULT_TARGET_VPD)
+        )
+        self._target_vpd_dirty = False
+        
+        # Device info shared by all growbox entities (read-only after registration)
+        self.device_info = {
+            "identifiers": {(DOMAIN, self.growbox_name)},
+            "name": self.growbox_name,
+            "manufacturer": MANUFACTURER,
+            "model": MODEL,
+        }
+        
+        # Latest parsed values of the source sensors, kept current by state events
+        self._source_values: dict[str, float | None] = {}
+        self._unsub_source_tracking: CALLBACK_TYPE | None = None
+        # Inputs of the last computed data, used to skip no-op updates
+        self._last_inputs: tuple[float, float, float] | None = None
+        
+        # Entity attributes, rebuilt only when the data changes
+        self.vpd_attributes: dict[str, Any] = {}
+        self.target_humidity_attributes: dict[str, Any] = {}
+        self.target_vpd_attributes: dict[str, Any] = {}
         
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{self.growbox_name}",
             update_interval=timedelta(seconds=SCAN_INTERVAL),
+            always_update=False,
+        )
+        
+        self._target_vpd_save_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=TARGET_VPD_SAVE_DELAY,
+            immediate=False,
+            function=self._async_save_target_vpd,
+        )
+        entry.async_on_unload(self._async_flush_target_vpd)
+        entry.async_on_unload(
+            hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, self._async_flush_target_vpd
+            )
+        )
+        
+        self._async_track_source_entities()
+        entry.async_on_unload(self._async_untrack_source_entities)
+
+    @callback
+    def _async_track_source_entities(self) -> None:
+        """Subscribe to state changes of the configured source sensors."""
+        self._async_untrack_source_entities()
+        
+        entity_ids = [
+            entity_id
+            for entity_id in (self.temperature_entity, self.humidity_entity)
+            if entity_id
+        ]
+        self._source_values = {
+            entity_id: self._state_to_float(self.hass.states.get(entity_id))
+            for entity_id in entity_ids
+        }
+        if entity_ids:
+            self._unsub_source_tracking = async_track_state_change_event(
+                self.hass, entity_ids, self._async_source_state_changed
+            )
+
+    @callback
+    def _async_untrack_source_entities(self) -> None:
+        """Unsubscribe from source sensor state changes."""
+        if self._unsub_source_tracking is not None:
+            self._unsub_source_tracking()
+            self._unsub_source_tracking = None
+
+    @callback
+    def _async_source_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Cache the new value of a source sensor."""
+        self._source_values[event.data["entity_id"]] = self._state_to_float(
+            event.data["new_state"]
         )
 
+    @staticmethod
+    def _state_to_float(state: State | None) -> float | None:
+        """Return the numeric value of a state, None if there is no reading."""
+        if state is None or state.state in _NO_READING_STATES:
+            return None
+        try:
+            return float(state.state)
+        except ValueError:
+            return None
+
+    def _read_float(self, entity_id: str | None, fallback: float) -> float:
+        """Return the cached value of a source sensor or the fallback."""
+        value = self._source_values.get(entity_id)
+        return fallback if value is None else value
+
     async def _async_update_data(self) -> dict[str, Any]:
-        """Update data from sensors."""
+        """Update data from the cached sensor values."""
         try:
-            if self.temperature_entity:
-                temp_state = self.hass.states.get(self.temperature_entity)
-                temperature = float(temp_state.state) if temp_state and temp_state.state != "unavailable" else 24.5
-            else:
-                temperature = 24.5
+            temperature = self._read_float(self.temperature_entity, 24.5)
+            humidity = self._read_float(self.humidity_entity, 65.0)
             
-            if self.humidity_entity:
-                humid_state = self.hass.states.get(self.humidity_entity)
-                humidity = float(humid_state.state) if humid_state and humid_state.state != "unavailable" else 65.0
-            else:
-                humidity = 65.0
+            inputs = (temperature, humidity, self.target_vpd)
+            if inputs == self._last_inputs and self.data is not None:
+                # Nothing moved - keep the previous data so listeners are not notified
+                return self.data
             
             vpd = calculate_vpd(temperature, humidity)
             target_humidity = calculate_target_humidity(temperature, self.target_vpd)
@@ -78,7 +184,27 @@ class GrowboxCoordinator(DataUpdateCoordinator):
                 "growbox_name": self.growbox_name,
             }
             
-            _LOGGER.debug("Updated data for %s: %s", self.growbox_name, data)
+            self.vpd_attributes = {
+                "status": get_vpd_status(vpd),
+                "temperature": temperature,
+                "humidity": humidity,
+                "target_vpd": self.target_vpd,
+                "target_humidity": target_humidity,
+            }
+            self.target_humidity_attributes = {
+                "target_vpd": self.target_vpd,
+                "current_humidity": humidity,
+                "humidity_diff": target_humidity - humidity,
+            }
+            self.target_vpd_attributes = {
+                "current_vpd": vpd,
+                "calculated_target_humidity": target_humidity,
+                "current_temperature": temperature,
+            }
+            
+            self._last_inputs = inputs
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Updated data for %s: %s", self.growbox_name, data)
             return data
             
         except Exception as err:
@@ -87,10 +213,27 @@ class GrowboxCoordinator(DataUpdateCoordinator):
     async def async_set_target_vpd(self, target_vpd: float) -> None:
         """Set target VPD value."""
         self.target_vpd = target_vpd
+        # Persist debounced, a slider drag writes the entry at most once per 2 s window
+        self._target_vpd_dirty = True
+        await self._target_vpd_save_debouncer.async_call()
+        # Refresh right away (not debounced) so the new target shows up immediately
+        await self.async_refresh()
+
+    @callback
+    def _async_save_target_vpd(self) -> None:
+        """Write a pending target VPD change to the config entry options."""
+        if not self._target_vpd_dirty:
+            return
+        self._target_vpd_dirty = False
         new_options = dict(self.entry.options)
-        new_options[CONF_TARGET_VPD] = target_vpd
+        new_options[CONF_TARGET_VPD] = self.target_vpd
         self.hass.config_entries.async_update_entry(self.entry, options=new_options)
-        await self.async_request_refresh()
+
+    @callback
+    def _async_flush_target_vpd(self, _event: Event | None = None) -> None:
+        """Save a pending target VPD change right away (unload/shutdown)."""
+        self._target_vpd_save_debouncer.async_cancel()
+        self._async_save_target_vpd()
 
     def update_config(self, config_data: dict[str, Any]) -> None:
         """Update configuration from options flow."""
@@ -102,13 +245,11 @@ class GrowboxCoordinator(DataUpdateCoordinator):
         if CONF_HYGROSTAT_ENTITY in config_data:
             self.hygrostat_entity = self._clean_entity_value(config_data[CONF_HYGROSTAT_ENTITY])
         
+        self._async_track_source_entities()
+        
     def _clean_entity_value(self, value: Any) -> str | None:
         """Clean entity value, return None for empty/invalid values."""
-        if value is None or value == "" or value == "None":
+        if not value:
             return None
-        if isinstance(value, str):
-            stripped = value.strip()
-            if stripped == "" or stripped.lower() == "none":
-                return None
-            return stripped
-        return str(value) if value else None
\ No newline at end of file
+        cleaned = value.strip() if isinstance(value, str) else str(value)
+        return None if cleaned.lower() in _EMPTY_ENTITY_TOKENS else cleaned
\ No newline at end of file
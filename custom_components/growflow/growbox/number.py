@@ -7,7 +7,7 @@ from typing import Any
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ..const import DOMAIN, UNIT_KPA, MANUFACTURER, MODEL, VPD_MIN, VPD_MAX
+from ..const import UNIT_KPA, VPD_MIN, VPD_MAX
 from .coordinator import GrowboxCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -16,24 +16,22 @@ _LOGGER = logging.getLogger(__name__)
 class GrowboxTargetVPDNumber(CoordinatorEntity, NumberEntity):
     """Target VPD number input for growbox."""
 
+    UID_SUFFIX = "_target_vpd"
+    NAME_SUFFIX = " Target VPD"
+
+    _attr_native_unit_of_measurement = UNIT_KPA
+    _attr_native_min_value = VPD_MIN
+    _attr_native_max_value = VPD_MAX
+    _attr_native_step = 0.1
+    _attr_mode = NumberMode.BOX
+    _attr_icon = "mdi:target"
+
     def __init__(self, coordinator: GrowboxCoordinator) -> None:
         """Initialize the target VPD number."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.growbox_name}_target_vpd"
-        self._attr_name = f"{coordinator.growbox_name} Target VPD"
-        self._attr_native_unit_of_measurement = UNIT_KPA
-        self._attr_native_min_value = VPD_MIN
-        self._attr_native_max_value = VPD_MAX
-        self._attr_native_step = 0.1
-        self._attr_mode = NumberMode.BOX
-        self._attr_icon = "mdi:target"
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.growbox_name)},
-            "name": coordinator.growbox_name,
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
+        self._attr_unique_id = coordinator.growbox_name + self.UID_SUFFIX
+        self._attr_name = coordinator.growbox_name + self.NAME_SUFFIX
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float:
@@ -42,14 +40,10 @@ class GrowboxTargetVPDNumber(CoordinatorEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the target VPD value."""
+        # The coordinator refresh writes the state of all growbox entities
         await self.coordinator.async_set_target_vpd(value)
-        self.async_write_ha_state()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        return {
-            "current_vpd": self.coordinator.data.get("vpd"),
-            "calculated_target_humidity": self.coordinator.data.get("target_humidity"),
-            "current_temperature": self.coordinator.data.get("temperature"),
-        }
\ No newline at end of file
+        return self.coordinator.target_vpd_attributes
\ No newline at end of file
@@ -12,9 +12,8 @@ from homeassistant.components.sensor import (
 from homeassistant.const import PERCENTAGE, UnitOfTemperature
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ..const import DOMAIN, UNIT_KPA, MANUFACTURER, MODEL
+from ..const import UNIT_KPA
 from .coordinator import GrowboxCoordinator
-from ..utils import get_vpd_status
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,28 +21,28 @@ _LOGGER = logging.getLogger(__name__)
 class GrowboxSensorBase(CoordinatorEntity, SensorEntity):
     """Base class for Growbox sensors."""
 
+    # Appended to the growbox name for unique_id and name
+    UID_SUFFIX: str
+    NAME_SUFFIX: str
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(self, coordinator: GrowboxCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.growbox_name)},
-            "name": coordinator.growbox_name,
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
+        self._attr_unique_id = coordinator.growbox_name + self.UID_SUFFIX
+        self._attr_name = coordinator.growbox_name + self.NAME_SUFFIX
+        self._attr_device_info = coordinator.device_info
 
 
 class GrowboxTemperatureSensor(GrowboxSensorBase):
     """Temperature sensor for growbox."""
 
-    def __init__(self, coordinator: GrowboxCoordinator) -> None:
-        """Initialize temperature sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.growbox_name}_temperature"
-        self._attr_name = f"{coordinator.growbox_name} Temperature"
-        self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-        self._attr_device_class = SensorDeviceClass.TEMPERATURE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
+    UID_SUFFIX = "_temperature"
+    NAME_SUFFIX = " Temperature"
+
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
 
     @property
     def native_value(self) -> float | None:
@@ -54,14 +53,11 @@ class GrowboxTemperatureSensor(GrowboxSensorBase):
 class GrowboxHumiditySensor(GrowboxSensorBase):
     """Humidity sensor for growbox."""
 
-    def __init__(self, coordinator: GrowboxCoordinator) -> None:
-        """Initialize humidity sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.growbox_name}_humidity"
-        self._attr_name = f"{coordinator.growbox_name} Humidity"
-        self._attr_native_unit_of_measurement = PERCENTAGE
-        self._attr_device_class = SensorDeviceClass.HUMIDITY
-        self._attr_state_class = SensorStateClass.MEASUREMENT
+    UID_SUFFIX = "_humidity"
+    NAME_SUFFIX = " Humidity"
+
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_device_class = SensorDeviceClass.HUMIDITY
 
     @property
     def native_value(self) -> float | None:
@@ -72,15 +68,12 @@ class GrowboxHumiditySensor(GrowboxSensorBase):
 class GrowboxVPDSensor(GrowboxSensorBase):
     """VPD sensor for growbox."""
 
-    def __init__(self, coordinator: GrowboxCoordinator) -> None:
-        """Initialize VPD sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.growbox_name}_vpd"
-        self._attr_name = f"{coordinator.growbox_name} VPD"
-        self._attr_native_unit_of_measurement = UNIT_KPA
-        self._attr_device_class = SensorDeviceClass.PRESSURE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:water-percent"
+    UID_SUFFIX = "_vpd"
+    NAME_SUFFIX = " VPD"
+
+    _attr_native_unit_of_measurement = UNIT_KPA
+    _attr_device_class = SensorDeviceClass.PRESSURE
+    _attr_icon = "mdi:water-percent"
 
     @property
     def native_value(self) -> float | None:
@@ -90,30 +83,18 @@ class GrowboxVPDSensor(GrowboxSensorBase):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        vpd = self.coordinator.data.get("vpd")
-        if vpd is not None:
-            return {
-                "status": get_vpd_status(vpd),
-                "temperature": self.coordinator.data.get("temperature"),
-                "humidity": self.coordinator.data.get("humidity"),
-                "target_vpd": self.coordinator.data.get("target_vpd"),
-                "target_humidity": self.coordinator.data.get("target_humidity"),
-            }
-        return {}
+        return self.coordinator.vpd_attributes
 
 
 class GrowboxTargetHumiditySensor(GrowboxSensorBase):
     """Target humidity sensor for growbox."""
 
-    def __init__(self, coordinator: GrowboxCoordinator) -> None:
-        """Initialize target humidity sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.growbox_name}_target_humidity"
-        self._attr_name = f"{coordinator.growbox_name} Target Humidity"
-        self._attr_native_unit_of_measurement = PERCENTAGE
-        self._attr_device_class = SensorDeviceClass.HUMIDITY
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:water-percent-alert"
+    UID_SUFFIX = "_target_humidity"
+    NAME_SUFFIX = " Target Humidity"
+
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_device_class = SensorDeviceClass.HUMIDITY
+    _attr_icon = "mdi:water-percent-alert"
 
     @property
     def native_value(self) -> float | None:
@@ -123,11 +104,4 @@ class GrowboxTargetHumiditySensor(GrowboxSensorBase):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        return {
-            "target_vpd": self.coordinator.data.get("target_vpd"),
-            "current_humidity": self.coordinator.data.get("humidity"),
-            "humidity_diff": (
-                self.coordinator.data.get("target_humidity", 0) - 
-                self.coordinator.data.get("humidity", 0)
-            ),
-        }
\ No newline at end of file
+        return self.coordinator.target_humidity_attributes
\ No newline at end of file
@@ -7,7 +7,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, CONF_GROWBOX_NAME
+from .const import DOMAIN
 from .growbox.coordinator import GrowboxCoordinator
 from .growbox.number import GrowboxTargetVPDNumber
 from .plant.coordinator import PlantCoordinator
@@ -6,7 +6,6 @@ import logging
 from homeassistant.components.button import ButtonEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ..const import DOMAIN, MANUFACTURER
 from .coordinator import PlantCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -18,13 +17,7 @@ class PlantButtonBase(CoordinatorEntity, ButtonEntity):
     def __init__(self, coordinator: PlantCoordinator) -> None:
         """Initialize the button entity."""
         super().__init__(coordinator)
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"plant_{coordinator.plant_id}")},
-            "name": f"{coordinator.plant_name} ({coordinator.plant_strain})",
-            "manufacturer": MANUFACTURER,
-            "model": "Plant",
-            "via_device": (DOMAIN, coordinator.growbox_name),
-        }
+        self._attr_device_info = coordinator.device_info
 
 
 class PlantWaterQuickButton(PlantButtonBase):
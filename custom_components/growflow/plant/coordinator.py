@@ -2,16 +2,22 @@
 from __future__ import annotations
 
 import logging
+import sys
+from collections import deque
 from datetime import datetime, timedelta, date
+from itertools import islice
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
 from ..const import (
     DOMAIN,
+    MANUFACTURER,
     SCAN_INTERVAL,
     CONF_PLANT_NAME,
     CONF_PLANT_STRAIN,
@@ -20,16 +26,56 @@ from ..const import (
     CONF_GROWTH_STAGE,
     CONF_DEFAULT_WATER_VOLUME,
     DEFAULT_WATER_VOLUME,
+    MAX_WATERING_HISTORY,
+    MAX_PLANT_HISTORY,
     GROWTH_STAGE_EARLY_VEG,
     GROWTH_STAGES,
+    GROWTH_STAGES_SET,
     VEG_PHASES,
     FLOWER_PHASES,
     POST_HARVEST_PHASES,  # ✅ NEW: Include post-harvest phases
     LEGACY_PHASE_MAPPING,
 )
+from ..utils import parse_iso_date
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds to collect history changes before writing the config entry
+HISTORY_SAVE_DELAY = 5
+
+# Version of the stored history format, 2 = legacy phases migrated
+HISTORY_SCHEMA_VERSION = 2
+
+# Stage -> stage names counted as that stage (itself plus merged legacy names)
+_PHASE_ALIASES: dict[str, frozenset[str]] = {
+    stage: frozenset(
+        {stage, *(old for old, new in LEGACY_PHASE_MAPPING.items() if new == stage)}
+    )
+    for stage in GROWTH_STAGES
+}
+
+# Stage -> data key of its day count
+_PHASE_KEY: dict[str, str] = {stage: f"days_in_{stage}" for stage in GROWTH_STAGES}
+
+# Stage -> data key of the phase total it counts towards
+_STAGE_TOTAL_KEY: dict[str, str] = {
+    **dict.fromkeys(VEG_PHASES, "total_veg_days"),
+    **dict.fromkeys(FLOWER_PHASES, "total_flower_days"),
+    **dict.fromkeys(POST_HARVEST_PHASES, "total_post_harvest_days"),
+}
+
+
+def _parse_timestamp(value: str) -> datetime | None:
+    """Parse a history timestamp.
+
+    Timestamps are written with datetime.isoformat(), so the C fast path
+    handles them; anything else goes through the lenient HA parser.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return dt_util.parse_datetime(value)
+
 
 class PlantCoordinator(DataUpdateCoordinator):
     """Coordinator to manage Plant data using simple state history array."""
@@ -42,40 +88,19 @@ class PlantCoordinator(DataUpdateCoordinator):
         self.plant_strain = entry.data.get(CONF_PLANT_STRAIN, "Unknown")
         self.growbox_name = entry.data[CONF_PLANT_GROWBOX]
         
-        # ✅ IMPROVED: More robust planted date parsing
+        # Planted date is a date right after the config flow and an ISO
+        # string once the entry has been stored
         planted_date_value = entry.data.get(CONF_PLANTED_DATE)
+        planted_date = planted_date_value
+        if isinstance(planted_date, str):
+            planted_date = parse_iso_date(planted_date)
         
-        try:
-            if planted_date_value is None or planted_date_value == "":
-                # No date provided, use today
-                self.planted_date = dt_util.now().date()
-                _LOGGER.warning("No planted date provided for %s, using today", self.plant_name)
-            elif isinstance(planted_date_value, date):
-                # Already a date object
-                self.planted_date = planted_date_value
-            elif isinstance(planted_date_value, str):
-                # String date, try to parse
-                if planted_date_value.strip() == "":
-                    self.planted_date = dt_util.now().date()
-                    _LOGGER.warning("Empty planted date string for %s, using today", self.plant_name)
-                else:
-                    parsed_date = dt_util.parse_date(planted_date_value)
-                    if parsed_date:
-                        self.planted_date = parsed_date
-                    else:
-                        self.planted_date = dt_util.now().date()
-                        _LOGGER.error("Could not parse planted date '%s' for %s, using today", 
-                                    planted_date_value, self.plant_name)
-            else:
-                # Unknown type, use fallback
-                self.planted_date = dt_util.now().date()
-                _LOGGER.error("Invalid planted date type %s for %s, using today", 
-                            type(planted_date_value), self.plant_name)
-        except Exception as e:
-            # Catch any parsing errors
+        if isinstance(planted_date, date):
+            self.planted_date = planted_date
+        else:
             self.planted_date = dt_util.now().date()
-            _LOGGER.error("Error parsing planted date for %s: %s, using today", 
-                        self.plant_name, str(e))
+            _LOGGER.error("Invalid planted date %r for %s, using today", 
+                        planted_date_value, self.plant_name)
         
         # ✅ IMPROVED: Validate the final date is reasonable
         today = dt_util.now().date()
@@ -92,13 +117,51 @@ class PlantCoordinator(DataUpdateCoordinator):
             entry.data.get(CONF_GROWTH_STAGE, GROWTH_STAGE_EARLY_VEG)
         )
         
-        # State history as simple array in config entry options
-        self.state_history = entry.options.get("state_history", [])
+        # History writes are batched, a burst of changes saves the entry once
+        self._save_pending = False
+        self._save_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=HISTORY_SAVE_DELAY,
+            immediate=False,
+            function=self._async_write_state_history,
+        )
+        entry.async_on_unload(self._async_flush_state_history)
+        entry.async_on_unload(
+            hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, self._async_flush_state_history
+            )
+        )
+        
+        # State history as simple array in config entry options. The lists are
+        # copied (and entries replaced, never edited) so a save always differs
+        # from the stored options - async_update_entry skips equal options.
+        self.state_history = list(entry.options.get("state_history", []))
         
         # Watering history system
-        self.watering_history = entry.options.get("watering_history", [])
+        self.watering_history = list(entry.options.get("watering_history", []))
+        # Counted separately because old entries are dropped from the history
+        self.total_watering_sessions = entry.options.get(
+            "total_watering_sessions", len(self.watering_history)
+        )
+        del self.watering_history[:-MAX_WATERING_HISTORY]
         self.default_water_volume = entry.options.get("default_water_volume", DEFAULT_WATER_VOLUME)
         
+        # Notes from the add_note service (in memory only, newest entries kept)
+        self.plant_history: deque[dict] = deque(maxlen=MAX_PLANT_HISTORY)
+        
+        # Share one string object per stage name between all loaded entries.
+        # Interned entries are copies - the dicts in entry.options stay untouched.
+        self.state_history = [
+            {**history_entry, "stage": sys.intern(history_entry["stage"])}
+            if isinstance(history_entry.get("stage"), str) else history_entry
+            for history_entry in self.state_history
+        ]
+        self.watering_history = [
+            {**history_entry, "growth_stage": sys.intern(history_entry["growth_stage"])}
+            if isinstance(history_entry.get("growth_stage"), str) else history_entry
+            for history_entry in self.watering_history
+        ]
         # ✅ IMPROVED: Migrate legacy phases in state history
         self._migrate_legacy_phases()
         
@@ -110,6 +173,28 @@ class PlantCoordinator(DataUpdateCoordinator):
             }]
             self._save_state_history()
         
+        # Parsed history dates/timestamps and volumes, kept parallel to the history lists
+        self._state_dates: list[date | None] = []
+        self._watering_times: list[datetime | None] = []
+        self._watering_volumes: list[int] = []
+        # Newest watering timestamp (history is chronological)
+        self._last_watering: datetime | None = None
+        # Volumes of the last 10 sessions and their running sum
+        self._recent_volumes: deque[int] = deque(maxlen=10)
+        self._recent_volume_total = 0
+        # Average days between the last sessions, only changes on a new watering
+        self._watering_frequency = 0.0
+        self._rebuild_history_index()
+        
+        # Day counts only change with the date or the state history
+        self._history_version = 0
+        self._phase_cache_key: tuple[int, date] | None = None
+        self._phase_cache: dict[str, int] = {}
+        # Day sums of all but the last history entry, per history version
+        self._closed_phase_version: int | None = None
+        self._closed_stage_days: dict[str, int] = {}
+        self._closed_totals: dict[str, int] = {}
+        
         # ✅ IMPROVED: Migrate current growth stage if it's legacy
         if self.growth_stage in LEGACY_PHASE_MAPPING:
             old_stage = self.growth_stage
@@ -120,33 +205,115 @@ class PlantCoordinator(DataUpdateCoordinator):
         self.plant_id = self.plant_name.lower().replace(" ", "_")
         self.select_entity_id = f"select.{self.plant_id}_growth_phase"
         
+        # Device info shared by all plant entities (read-only after registration)
+        self.device_info = {
+            "identifiers": {(DOMAIN, f"plant_{self.plant_id}")},
+            "name": f"{self.plant_name} ({self.plant_strain})",
+            "manufacturer": MANUFACTURER,
+            "model": "Plant",
+            "via_device": (DOMAIN, self.growbox_name),
+        }
+        
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_plant_{self.plant_id}",
             update_interval=timedelta(seconds=SCAN_INTERVAL),
+            # Most refreshes produce identical data - don't rewrite the entities then
+            always_update=False,
         )
 
     def _save_state_history(self) -> None:
-        """Save state history to config entry options."""
-        new_options = dict(self.entry.options)
-        new_options["state_history"] = self.state_history
-        new_options["watering_history"] = self.watering_history
-        new_options["default_water_volume"] = self.default_water_volume
-        new_options[CONF_GROWTH_STAGE] = self.growth_stage
-        self.hass.config_entries.async_update_entry(self.entry, options=new_options)
+        """Schedule saving the state history to the config entry options."""
+        self._save_pending = True
+        self._save_debouncer.async_schedule_call()
+
+    @callback
+    def _async_write_state_history(self, data: dict[str, Any] | None = None) -> None:
+        """Write pending history changes to the config entry options.
+        
+        Changed entry data can be passed along so both end up in one update.
+        """
+        if not self._save_pending:
+            return
+        self._save_pending = False
+        self.hass.config_entries.async_update_entry(
+            self.entry,
+            data=self.entry.data if data is None else data,
+            options={
+                **self.entry.options,
+                "state_history": list(self.state_history),
+                "watering_history": list(self.watering_history),
+                "total_watering_sessions": self.total_watering_sessions,
+                "default_water_volume": self.default_water_volume,
+                CONF_GROWTH_STAGE: self.growth_stage,
+                "schema_version": HISTORY_SCHEMA_VERSION,
+            },
+        )
+
+    @callback
+    def _async_flush_state_history(self, _event: Event | None = None) -> None:
+        """Write pending history changes right away (unload/shutdown)."""
+        self._save_debouncer.async_cancel()
+        self._async_write_state_history()
+
+    def _rebuild_history_index(self) -> None:
+        """Parse all history dates once into the parallel lists."""
+        self._state_dates = [parse_iso_date(entry["date"]) for entry in self.state_history]
+        self._watering_times = [
+            self._parse_watering_time(entry) for entry in self.watering_history
+        ]
+        self._watering_volumes = [entry.get("volume_ml", 0) for entry in self.watering_history]
+        self._last_watering = self._watering_times[-1] if self._watering_times else None
+        
+        self._recent_volumes.clear()
+        self._recent_volume_total = 0
+        for volume_ml in self._watering_volumes[-self._recent_volumes.maxlen:]:
+            self._add_recent_volume(volume_ml)
+        self._watering_frequency = self._calculate_watering_frequency()
+
+    def _add_recent_volume(self, volume_ml: int) -> None:
+        """Push a session volume, keeping the running sum of the last 10."""
+        if len(self._recent_volumes) == self._recent_volumes.maxlen:
+            self._recent_volume_total -= self._recent_volumes[0]
+        self._recent_volumes.append(volume_ml)
+        self._recent_volume_total += volume_ml
+
+    def _trim_watering_history(self) -> None:
+        """Drop the oldest watering entries beyond MAX_WATERING_HISTORY."""
+        del self.watering_history[:-MAX_WATERING_HISTORY]
+        del self._watering_times[:-MAX_WATERING_HISTORY]
+        del self._watering_volumes[:-MAX_WATERING_HISTORY]
+
+    @staticmethod
+    def _parse_watering_time(entry: dict[str, Any]) -> datetime | None:
+        """Parse the timestamp of a watering entry, None if invalid."""
+        try:
+            timestamp = _parse_timestamp(entry["timestamp"])
+        except (KeyError, ValueError, TypeError) as e:
+            _LOGGER.debug("Skipping invalid timestamp in watering history: %s", e)
+            return None
+        # Naive timestamps can't be compared with the aware ones we write
+        if timestamp is None or timestamp.tzinfo is None:
+            return None
+        return timestamp
 
     def _migrate_legacy_phases(self) -> None:
         """Migrate legacy phase names in state history to new phases."""
+        if self.entry.options.get("schema_version", 0) >= HISTORY_SCHEMA_VERSION:
+            return
+        # Store the schema version with the next save, even if nothing migrates
+        self._save_state_history()
+        
         if not self.state_history:
             return
         
         migrated = False
-        for entry in self.state_history:
+        for index, entry in enumerate(self.state_history):
             old_stage = entry.get("stage")
             if old_stage in LEGACY_PHASE_MAPPING:
                 new_stage = LEGACY_PHASE_MAPPING[old_stage]
-                entry["stage"] = new_stage
+                self.state_history[index] = {**entry, "stage": new_stage}
                 migrated = True
                 _LOGGER.info("Migrated phase %s to %s in state history", old_stage, new_stage)
         
@@ -157,212 +324,178 @@ class PlantCoordinator(DataUpdateCoordinator):
 
     def _consolidate_consecutive_phases(self) -> None:
         """Consolidate consecutive state history entries with the same phase."""
-        if len(self.state_history) <= 1:
+        history = self.state_history
+        if len(history) <= 1:
             return
         
-        consolidated = [self.state_history[0]]  # Keep first entry
-        
-        for entry in self.state_history[1:]:
-            last_entry = consolidated[-1]
-            if entry["stage"] == last_entry["stage"]:
-                # Same phase as previous - skip this entry (keeps earliest date)
-                continue
-            else:
-                # Different phase - add to consolidated list
-                consolidated.append(entry)
-        
-        if len(consolidated) != len(self.state_history):
-            self.state_history = consolidated
-            _LOGGER.info("Consolidated %d duplicate phase entries", 
-                        len(self.state_history) - len(consolidated))
+        # In-place compaction: keep the first entry of each run (earliest date)
+        write = 1
+        for read in range(1, len(history)):
+            if history[read]["stage"] != history[write - 1]["stage"]:
+                history[write] = history[read]
+                write += 1
+        
+        removed = len(history) - write
+        if removed:
+            del history[write:]
+            _LOGGER.info("Consolidated %d duplicate phase entries", removed)
 
-    def _calculate_days_in_phase(self, target_phase: str) -> int:
-        """Calculate days in a specific phase from state history array."""
-        total_days = 0
-        current_phase_start = None
-        
-        # Handle combined phases by checking for both old and new phase names
-        phases_to_check = [target_phase]
+    def _calculate_phase_days(self, today: date) -> dict[str, int]:
+        """Calculate days per phase and phase totals from the state history.
+        
+        Each entry lasts until the next entry (or today); legacy phase names
+        count towards the phase they were merged into. Finished entries only
+        change with the history, so their sums are cached per history version
+        and only the open last entry is added per day.
+        """
+        if self._closed_phase_version != self._history_version:
+            self._closed_stage_days, self._closed_totals = self._sum_closed_phase_days()
+            self._closed_phase_version = self._history_version
+        
+        stage_days = dict(self._closed_stage_days)
+        totals = dict(self._closed_totals)
+        if self.state_history:
+            self._add_phase_segment(
+                stage_days,
+                totals,
+                self.state_history[-1]["stage"],
+                (today - self._state_dates[-1]).days,
+            )
+        
+        phase_days = {_PHASE_KEY[stage]: days for stage, days in stage_days.items()}
+        phase_days.update(totals)
+        return phase_days
+
+    def _sum_closed_phase_days(self) -> tuple[dict[str, int], dict[str, int]]:
+        """Sum the days of all finished history entries in a single pass."""
+        stage_days = dict.fromkeys(GROWTH_STAGES, 0)
+        totals = dict.fromkeys(_STAGE_TOTAL_KEY.values(), 0)
+        
+        for entry, start_date, end_date in zip(
+            self.state_history, self._state_dates, islice(self._state_dates, 1, None)
+        ):
+            self._add_phase_segment(
+                stage_days, totals, entry["stage"], (end_date - start_date).days
+            )
+        
+        return stage_days, totals
+
+    @staticmethod
+    def _add_phase_segment(
+        stage_days: dict[str, int], totals: dict[str, int], stage: str, days: int
+    ) -> None:
+        """Add the days of one history entry to its phase and phase total."""
+        stage = LEGACY_PHASE_MAPPING.get(stage, stage)
+        if stage not in stage_days:
+            return
         
-        # For combined phases, also check legacy phases
-        if target_phase == "mid_late_veg":
-            phases_to_check.extend(["mid_veg", "late_veg"])
-        elif target_phase == "mid_late_flower":
-            phases_to_check.extend(["mid_flower", "late_flower"])
-        
-        for entry in self.state_history:
-            entry_date = dt_util.parse_date(entry["date"])
-            entry_stage = entry["stage"]
-            
-            if entry_stage in phases_to_check:
-                # Phase starts
-                if current_phase_start is None:
-                    current_phase_start = entry_date
-            else:
-                # Phase ends
-                if current_phase_start is not None:
-                    total_days += (entry_date - current_phase_start).days
-                    current_phase_start = None
-        
-        # If still in this phase, calculate until today
-        if current_phase_start is not None:
-            total_days += (dt_util.now().date() - current_phase_start).days
-        
-        return total_days
-
-    def _calculate_days_in_current_phase(self) -> int:
+        stage_days[stage] += days
+        total_key = _STAGE_TOTAL_KEY.get(stage)
+        if total_key:
+            totals[total_key] += days
+
+    def _calculate_days_in_current_phase(self, today: date) -> int:
         """Calculate days in current phase."""
-        phases_to_check = [self.growth_stage]
-        
         # For combined phases, also check legacy phases
-        if self.growth_stage == "mid_late_veg":
-            phases_to_check.extend(["mid_veg", "late_veg"])
-        elif self.growth_stage == "mid_late_flower":
-            phases_to_check.extend(["mid_flower", "late_flower"])
+        phases_to_check = _PHASE_ALIASES.get(self.growth_stage) or {self.growth_stage}
         
         # Find the last entry with current stage (or legacy equivalent)
-        for entry in reversed(self.state_history):
+        for entry, start_date in zip(reversed(self.state_history), reversed(self._state_dates)):
             if entry["stage"] in phases_to_check:
-                start_date = dt_util.parse_date(entry["date"])
-                return (dt_util.now().date() - start_date).days
+                return (today - start_date).days
         
         # Fallback
         return 0
 
-    def _calculate_total_veg_days(self) -> int:
-        """Calculate total days in vegetative phases."""
-        total = 0
-        for phase in VEG_PHASES:
-            total += self._calculate_days_in_phase(phase)
-        return total
-
-    def _calculate_total_flower_days(self) -> int:
-        """Calculate total days in flowering phases."""
-        total = 0
-        for phase in FLOWER_PHASES:
-            total += self._calculate_days_in_phase(phase)
-        return total
-
-    def _calculate_total_post_harvest_days(self) -> int:
-        """Calculate total days in post-harvest phases (drying + curing)."""
-        total = 0
-        for phase in POST_HARVEST_PHASES:
-            total += self._calculate_days_in_phase(phase)
-        return total
-
     def _get_last_watering(self) -> datetime | None:
         """Get timestamp of last watering."""
-        if not self.watering_history:
-            return None
-        
-        last_entry = self.watering_history[-1]
-        timestamp_str = last_entry["timestamp"]
-        
-        try:
-            return dt_util.parse_datetime(timestamp_str)
-        except (ValueError, TypeError) as e:
-            _LOGGER.error("Failed to parse watering timestamp %s: %s", timestamp_str, e)
-            return None
+        return self._last_watering
 
-    def _calculate_days_since_watering(self) -> int | None:
+    def _calculate_days_since_watering(self, now: datetime) -> int | None:
         """Calculate days since last watering."""
         last_watering = self._get_last_watering()
         if not last_watering:
             return None
         
         try:
-            return (dt_util.now() - last_watering).days
+            return (now - last_watering).days
         except (TypeError, AttributeError) as e:
             _LOGGER.error("Failed to calculate days since watering: %s", e)
             return None
 
-    def _calculate_water_this_week(self) -> int:
+    def _calculate_water_this_week(self, now: datetime) -> int:
         """Calculate total water volume in last 7 days."""
         if not self.watering_history:
             return 0
         
-        week_ago = dt_util.now() - timedelta(days=7)
-        total = 0
+        week_ago = now - timedelta(days=7)
         
-        for entry in self.watering_history:
-            try:
-                entry_time = dt_util.parse_datetime(entry["timestamp"])
-                if entry_time and entry_time >= week_ago:
-                    total += entry.get("volume_ml", 0)
-            except (ValueError, TypeError) as e:
-                _LOGGER.debug("Skipping invalid timestamp in watering history: %s", e)
+        # History is chronological - walk back from the newest entry and stop
+        # at the first valid one before the window (invalid timestamps are None)
+        total = 0
+        for entry_time, volume_ml in zip(
+            reversed(self._watering_times), reversed(self._watering_volumes)
+        ):
+            if entry_time is None:
                 continue
-        
+            if entry_time < week_ago:
+                break
+            total += volume_ml
         return total
 
     def _calculate_avg_water_per_session(self) -> float:
         """Calculate average water volume per session (last 10 sessions)."""
-        if not self.watering_history:
-            return 0.0
-        
-        # Take last 10 sessions
-        recent_sessions = self.watering_history[-10:]
-        if not recent_sessions:
+        if not self._recent_volumes:
             return 0.0
         
-        total_volume = sum(entry.get("volume_ml", 0) for entry in recent_sessions)
-        return round(total_volume / len(recent_sessions), 1)
+        return round(self._recent_volume_total / len(self._recent_volumes), 1)
 
     def _calculate_watering_frequency(self) -> float:
         """Calculate average days between watering sessions."""
-        if len(self.watering_history) < 2:
-            return 0.0
-        
-        # Calculate differences between last 5 sessions
-        recent_sessions = self.watering_history[-5:]
-        if len(recent_sessions) < 2:
+        times = self._watering_times
+        end = len(times)
+        if end < 2:
             return 0.0
         
         total_days = 0
         count = 0
         
-        for i in range(1, len(recent_sessions)):
-            try:
-                prev_time = dt_util.parse_datetime(recent_sessions[i-1]["timestamp"])
-                curr_time = dt_util.parse_datetime(recent_sessions[i]["timestamp"])
-                
-                if prev_time and curr_time:
-                    days_diff = (curr_time - prev_time).days
-                    if days_diff > 0:  # Ignore same-day waterings
-                        total_days += days_diff
-                        count += 1
-            except (ValueError, TypeError) as e:
-                _LOGGER.debug("Skipping invalid timestamps in frequency calculation: %s", e)
-                continue
+        # Calculate differences between last 5 sessions (invalid timestamps are None)
+        for i in range(max(1, end - 4), end):
+            prev_time = times[i - 1]
+            curr_time = times[i]
+            if prev_time and curr_time:
+                days_diff = (curr_time - prev_time).days
+                if days_diff > 0:  # Ignore same-day waterings
+                    total_days += days_diff
+                    count += 1
         
         return round(total_days / count, 1) if count > 0 else 0.0
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data using simple state history."""
         try:
-            # Calculate days since planted
-            today = dt_util.now().date()
-            days_since_planted = (today - self.planted_date).days
-            
-            # Phase calculations from state history
-            days_in_current_phase = self._calculate_days_in_current_phase()
-            
-            # Calculate days for each phase from state history
-            phase_days = {}
-            for phase in GROWTH_STAGES:
-                phase_days[f"days_in_{phase}"] = self._calculate_days_in_phase(phase)
-            
-            # Calculate totals
-            total_veg_days = self._calculate_total_veg_days()
-            total_flower_days = self._calculate_total_flower_days()
-            total_post_harvest_days = self._calculate_total_post_harvest_days()  # ✅ NEW
+            # One clock reading per update for consistent values
+            now = dt_util.now()
+            today = now.date()
+            cache_key = (self._history_version, today)
+            if cache_key != self._phase_cache_key:
+                self._phase_cache = {
+                    # Calculate days since planted
+                    "days_since_planted": (today - self.planted_date).days,
+                    # Phase calculations from state history
+                    "days_in_current_phase": self._calculate_days_in_current_phase(today),
+                    # Days per phase and phase totals from state history
+                    **self._calculate_phase_days(today),
+                }
+                self._phase_cache_key = cache_key
             
             # Watering calculations
             last_watering = self._get_last_watering()
-            days_since_watering = self._calculate_days_since_watering()
-            water_this_week = self._calculate_water_this_week()
+            days_since_watering = self._calculate_days_since_watering(now)
+            water_this_week = self._calculate_water_this_week(now)
             avg_water_per_session = self._calculate_avg_water_per_session()
-            watering_frequency = self._calculate_watering_frequency()
+            watering_frequency = self._watering_frequency
             
             data = {
                 "plant_name": self.plant_name,
@@ -370,11 +503,6 @@ class PlantCoordinator(DataUpdateCoordinator):
                 "growbox_name": self.growbox_name,
                 "planted_date": self.planted_date,
                 "growth_stage": self.growth_stage,
-                "days_since_planted": days_since_planted,
-                "days_in_current_phase": days_in_current_phase,
-                "total_veg_days": total_veg_days,
-                "total_flower_days": total_flower_days,
-                "total_post_harvest_days": total_post_harvest_days,  # ✅ NEW
                 # Watering data
                 "default_water_volume": self.default_water_volume,
                 "last_watering": last_watering,
@@ -382,11 +510,12 @@ class PlantCoordinator(DataUpdateCoordinator):
                 "water_this_week": water_this_week,
                 "avg_water_per_session": avg_water_per_session,
                 "watering_frequency": watering_frequency,
-                "total_watering_sessions": len(self.watering_history),
-                **phase_days,
+                "total_watering_sessions": self.total_watering_sessions,
+                **self._phase_cache,
             }
             
-            _LOGGER.debug("Updated plant data using state history: %s", self.plant_name)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Updated plant data using state history: %s", self.plant_name)
             return data
             
         except Exception as err:
@@ -394,7 +523,7 @@ class PlantCoordinator(DataUpdateCoordinator):
 
     async def async_change_growth_stage(self, new_stage: str, notes: str | None = None) -> None:
         """Change growth stage and update state history."""
-        if new_stage not in GROWTH_STAGES:
+        if new_stage not in GROWTH_STAGES_SET:
             _LOGGER.error("Invalid growth stage: %s", new_stage)
             return
         
@@ -405,10 +534,13 @@ class PlantCoordinator(DataUpdateCoordinator):
         self.growth_stage = new_stage
         
         # Add to state history array
+        today = dt_util.now().date()
         self.state_history.append({
-            "date": dt_util.now().date().isoformat(),
+            "date": today.isoformat(),
             "stage": new_stage
         })
+        self._state_dates.append(today)
+        self._history_version += 1
         
         # Save to config entry
         self._save_state_history()
@@ -419,19 +551,23 @@ class PlantCoordinator(DataUpdateCoordinator):
     async def async_update_planted_date(self, new_date: date) -> None:
         """Update planted date and adjust state history."""
         old_date = self.planted_date
+        if old_date == new_date:
+            return
         self.planted_date = new_date
+        new_date_iso = new_date.isoformat()
         
         # Update first entry in state history
         if self.state_history:
-            self.state_history[0]["date"] = new_date.isoformat()
-        
-        # Update config entry
-        new_data = dict(self.entry.data)
-        new_data[CONF_PLANTED_DATE] = new_date.isoformat()
-        self.hass.config_entries.async_update_entry(self.entry, data=new_data)
-        
-        # Save state history
-        self._save_state_history()
+            self.state_history[0] = {**self.state_history[0], "date": new_date_iso}
+            self._state_dates[0] = new_date
+        self._history_version += 1
+        
+        # Write planted date and state history in a single config entry update
+        self._save_pending = True
+        self._save_debouncer.async_cancel()
+        self._async_write_state_history(
+            data={**self.entry.data, CONF_PLANTED_DATE: new_date_iso}
+        )
         
         await self.async_request_refresh()
         _LOGGER.info("Updated planted date for %s: %s -> %s", self.plant_name, old_date, new_date)
@@ -439,6 +575,8 @@ class PlantCoordinator(DataUpdateCoordinator):
     async def async_update_strain(self, new_strain: str) -> None:
         """Update plant strain."""
         old_strain = self.plant_strain
+        if old_strain == new_strain:
+            return
         self.plant_strain = new_strain
         
         # Update config entry
@@ -456,14 +594,22 @@ class PlantCoordinator(DataUpdateCoordinator):
     # Watering system methods
     async def async_add_watering_entry(self, volume_ml: int, notes: str | None = None) -> None:
         """Add watering entry to history."""
+        now = dt_util.now()
         entry = {
-            "timestamp": dt_util.now().isoformat(),
+            "timestamp": now.isoformat(),
             "volume_ml": volume_ml,
             "growth_stage": self.growth_stage,
             "notes": notes,
         }
         
         self.watering_history.append(entry)
+        self._watering_times.append(now)
+        self._watering_volumes.append(volume_ml)
+        self._last_watering = now
+        self._add_recent_volume(volume_ml)
+        self._watering_frequency = self._calculate_watering_frequency()
+        self.total_watering_sessions += 1
+        self._trim_watering_history()
         self._save_state_history()
         
         await self.async_request_refresh()
@@ -475,6 +621,8 @@ class PlantCoordinator(DataUpdateCoordinator):
 
     async def async_update_default_water_volume(self, volume_ml: int) -> None:
         """Update default water volume."""
+        if self.default_water_volume == volume_ml:
+            return
         self.default_water_volume = volume_ml
         self._save_state_history()
         await self.async_request_refresh()
@@ -488,5 +636,6 @@ class PlantCoordinator(DataUpdateCoordinator):
         """Update configuration from options flow."""
         if CONF_GROWTH_STAGE in config_data:
             self.growth_stage = config_data[CONF_GROWTH_STAGE]
+            self._history_version += 1
         if CONF_DEFAULT_WATER_VOLUME in config_data:
             self.default_water_volume = config_data[CONF_DEFAULT_WATER_VOLUME]
\ No newline at end of file
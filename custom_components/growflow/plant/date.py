@@ -6,9 +6,7 @@ from datetime import date
 
 from homeassistant.components.date import DateEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import dt as dt_util
 
-from ..const import DOMAIN, MANUFACTURER
 from .coordinator import PlantCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -20,13 +18,7 @@ class PlantDateBase(CoordinatorEntity, DateEntity):
     def __init__(self, coordinator: PlantCoordinator) -> None:
         """Initialize the date entity."""
         super().__init__(coordinator)
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"plant_{coordinator.plant_id}")},
-            "name": f"{coordinator.plant_name} ({coordinator.plant_strain})",
-            "manufacturer": MANUFACTURER,
-            "model": "Plant",
-            "via_device": (DOMAIN, coordinator.growbox_name),
-        }
+        self._attr_device_info = coordinator.device_info
 
 
 class PlantPlantedDateEntity(PlantDateBase):
@@ -6,7 +6,7 @@ import logging
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ..const import DOMAIN, MANUFACTURER, UNIT_ML
+from ..const import UNIT_ML
 from .coordinator import PlantCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -18,13 +18,7 @@ class PlantNumberBase(CoordinatorEntity, NumberEntity):
     def __init__(self, coordinator: PlantCoordinator) -> None:
         """Initialize the number entity."""
         super().__init__(coordinator)
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"plant_{coordinator.plant_id}")},
-            "name": f"{coordinator.plant_name} ({coordinator.plant_strain})",
-            "manufacturer": MANUFACTURER,
-            "model": "Plant",
-            "via_device": (DOMAIN, coordinator.growbox_name),
-        }
+        self._attr_device_info = coordinator.device_info
 
 
 class PlantDefaultWaterVolumeNumber(PlantNumberBase):
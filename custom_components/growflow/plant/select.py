@@ -7,8 +7,6 @@ from homeassistant.components.select import SelectEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from ..const import (
-    DOMAIN, 
-    MANUFACTURER, 
     GROWTH_STAGES, 
     GROWTH_STAGE_LABELS
 )
@@ -16,6 +14,9 @@ from .coordinator import PlantCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Reverse lookup: UI label -> growth stage
+_LABEL_TO_STAGE = {label: stage for stage, label in GROWTH_STAGE_LABELS.items()}
+
 
 class PlantSelectBase(CoordinatorEntity, SelectEntity):
     """Base class for Plant select entities."""
@@ -23,25 +24,20 @@ class PlantSelectBase(CoordinatorEntity, SelectEntity):
     def __init__(self, coordinator: PlantCoordinator) -> None:
         """Initialize the select entity."""
         super().__init__(coordinator)
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"plant_{coordinator.plant_id}")},
-            "name": f"{coordinator.plant_name} ({coordinator.plant_strain})",
-            "manufacturer": MANUFACTURER,
-            "model": "Plant",
-            "via_device": (DOMAIN, coordinator.growbox_name),
-        }
+        self._attr_device_info = coordinator.device_info
 
 
 class PlantGrowthPhaseSelect(PlantSelectBase):
     """Growth phase select entity."""
 
+    _attr_options = [GROWTH_STAGE_LABELS[stage] for stage in GROWTH_STAGES]
+
     def __init__(self, coordinator: PlantCoordinator) -> None:
         """Initialize growth phase select entity."""
         super().__init__(coordinator)
         self._attr_unique_id = f"plant_{coordinator.plant_id}_growth_phase"
         self._attr_name = f"{coordinator.plant_name} Wachstumsphase"
         self._attr_icon = "mdi:sprout-outline"
-        self._attr_options = [GROWTH_STAGE_LABELS[stage] for stage in GROWTH_STAGES]
 
     @property
     def current_option(self) -> str | None:
@@ -51,12 +47,7 @@ class PlantGrowthPhaseSelect(PlantSelectBase):
 
     async def async_select_option(self, option: str) -> None:
         """Select new growth phase."""
-        # Find stage key by label
-        stage_key = None
-        for key, label in GROWTH_STAGE_LABELS.items():
-            if label == option:
-                stage_key = key
-                break
+        stage_key = _LABEL_TO_STAGE.get(option)
         
         if stage_key:
             # Update coordinator
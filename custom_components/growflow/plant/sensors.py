@@ -12,11 +12,8 @@ from homeassistant.components.sensor import (
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from ..const import (
-    DOMAIN,
-    MANUFACTURER,
     UNIT_DAYS,
     UNIT_ML,
-    GROWTH_STAGES,
     GROWTH_STAGE_LABELS,
 )
 from .coordinator import PlantCoordinator
@@ -30,13 +27,7 @@ class PlantSensorBase(CoordinatorEntity, SensorEntity):
     def __init__(self, coordinator: PlantCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"plant_{coordinator.plant_id}")},
-            "name": f"{coordinator.plant_name} ({coordinator.plant_strain})",
-            "manufacturer": MANUFACTURER,
-            "model": "Plant",
-            "via_device": (DOMAIN, coordinator.growbox_name),
-        }
+        self._attr_device_info = coordinator.device_info
 
 
 class PlantHistoryDebugSensor(PlantSensorBase):
@@ -350,9 +341,8 @@ class PlantWateringDebugSensor(PlantSensorBase):
 
     @property
     def native_value(self) -> str:
-        """Return number of watering entries."""
-        history = self.coordinator.get_watering_history()
-        return f"{len(history)} sessions"
+        """Return number of watering sessions."""
+        return f"{self.coordinator.total_watering_sessions} sessions"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -363,7 +353,8 @@ class PlantWateringDebugSensor(PlantSensorBase):
             "plant_id": self.coordinator.plant_id,
             "default_water_volume": self.coordinator.default_water_volume,
             "watering_history": history[-5:] if history else [],  # Last 5 entries
-            "total_sessions": len(history),
+            "total_sessions": self.coordinator.total_watering_sessions,
+            "stored_sessions": len(history),
             "tracking_method": "watering_history_array",
             "storage_location": "config_entry_options",
             "first_watering": history[0] if history else None,
@@ -56,28 +56,10 @@ def async_setup_services(hass: HomeAssistant) -> None:
         
         coordinator = _get_plant_coordinator_by_entity(hass, entity_id)
         if coordinator:
-            # Update the coordinator
+            # The coordinator refresh writes the state of all plant entities,
+            # including the growth phase select
             await coordinator.async_change_growth_stage(new_stage, notes)
             
-            # Also update the select entity to maintain consistency
-            select_entity_id = coordinator.select_entity_id
-            select_entity = hass.states.get(select_entity_id)
-            
-            if select_entity:
-                # Get the label for the new stage
-                new_stage_label = GROWTH_STAGE_LABELS.get(new_stage, new_stage)
-                
-                # Call the select entity's service to update it
-                await hass.services.async_call(
-                    "select",
-                    "select_option",
-                    {
-                        "entity_id": select_entity_id,
-                        "option": new_stage_label,
-                    },
-                    blocking=True,
-                )
-            
             stage_label = GROWTH_STAGE_LABELS.get(new_stage, new_stage)
             _LOGGER.info("Changed phase for plant %s: %s (via service)", coordinator.plant_name, stage_label)
         else:
@@ -2,12 +2,10 @@
 from __future__ import annotations
 
 import logging
-import re
 
 from homeassistant.components.text import TextEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ..const import DOMAIN, MANUFACTURER
 from .coordinator import PlantCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -19,13 +17,7 @@ class PlantTextBase(CoordinatorEntity, TextEntity):
     def __init__(self, coordinator: PlantCoordinator) -> None:
         """Initialize the text entity."""
         super().__init__(coordinator)
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"plant_{coordinator.plant_id}")},
-            "name": f"{coordinator.plant_name} ({coordinator.plant_strain})",
-            "manufacturer": MANUFACTURER,
-            "model": "Plant",
-            "via_device": (DOMAIN, coordinator.growbox_name),
-        }
+        self._attr_device_info = coordinator.device_info
 
 
 class PlantStrainEntity(PlantTextBase):
@@ -1,7 +1,20 @@
 """Utility functions for GrowFlow."""
-import math
+from datetime import date
+from functools import lru_cache
+from math import exp
 
+# Magnus-Formel Konstanten (SVP in kPa, Temperatur in °C)
+_MAGNUS_P0 = 0.6108
+_MAGNUS_A = 17.27
+_MAGNUS_B = 237.3
 
+
+def _saturation_vapor_pressure(temperature: float) -> float:
+    """Return the saturated vapor pressure in kPa (Magnus formula)."""
+    return _MAGNUS_P0 * exp((_MAGNUS_A * temperature) / (temperature + _MAGNUS_B))
+
+
+@lru_cache(maxsize=512)
 def calculate_vpd(temperature: float, humidity: float) -> float:
     """
     Calculate Vapor Pressure Deficit (VPD) in kPa.
@@ -11,9 +24,11 @@ def calculate_vpd(temperature: float, humidity: float) -> float:
     Where:
     - SVP = Saturated Vapor Pressure
     - RH = Relative Humidity
+    
+    Cached on the exact readings, which repeat between sensor updates.
     """
     # Saturated Vapor Pressure berechnen (Magnus-Formel)
-    svp = 0.6108 * math.exp((17.27 * temperature) / (temperature + 237.3))
+    svp = _saturation_vapor_pressure(temperature)
     
     # VPD berechnen
     vpd = svp * (1 - humidity / 100)
@@ -21,8 +36,12 @@ def calculate_vpd(temperature: float, humidity: float) -> float:
     return round(vpd, 2)
 
 
+@lru_cache(maxsize=256)
 def get_vpd_status(vpd: float) -> str:
-    """Get VPD status description."""
+    """Get VPD status description.
+
+    VPD values are already rounded to 0.01 kPa, so the cache stays small.
+    """
     if vpd < 0.5:
         return "Too Low"
     elif vpd > 1.5:
@@ -33,15 +52,18 @@ def get_vpd_status(vpd: float) -> str:
         return "Good"
 
 
+@lru_cache(maxsize=512)
 def calculate_target_humidity(temperature: float, target_vpd: float) -> float:
     """
     Calculate target humidity based on temperature and target VPD.
     
     VPD = SVP * (1 - RH/100)
     => RH = (1 - VPD/SVP) * 100
+    
+    Cached on the exact inputs, which repeat between sensor updates.
     """
     # Saturated Vapor Pressure berechnen
-    svp = 0.6108 * math.exp((17.27 * temperature) / (temperature + 237.3))
+    svp = _saturation_vapor_pressure(temperature)
     
     # Ziel-Feuchtigkeit berechnen
     target_humidity = (1 - target_vpd / svp) * 100
@@ -52,6 +74,19 @@ def calculate_target_humidity(temperature: float, target_vpd: float) -> float:
     return round(target_humidity, 1)
 
 
+@lru_cache(maxsize=256)
+def parse_iso_date(value: str) -> date | None:
+    """Parse an ISO 8601 date string, return None for invalid values.
+
+    Results are cached per string; date objects are immutable so sharing
+    them between plants is safe.
+    """
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
 def celsius_to_fahrenheit(celsius: float) -> float:
     """Convert Celsius to Fahrenheit."""
     return (celsius * 9/5) + 32
\ No newline at end of file